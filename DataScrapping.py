@@ -5,51 +5,188 @@
 
 
 # Importing the libraries
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import httpx
+from aiolimiter import AsyncLimiter
+from lxml import etree
 import pandas as pd
-import time
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import os
-import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import csv
+import time
+import queue
+import shutil
+import sqlite3
+import threading
+from functools import partial
 from tqdm import tqdm
 
 
 # In[ ]:
 
 
+# Defining HTTP client helpers
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+# Accept-Encoding is left to httpx, which only advertises the encodings it can
+# decode (br is added once the brotli extra is installed)
+
+def create_client(max_workers=5):
+    """
+    Creating one async HTTP/2 client shared by all tasks, so every request
+    is multiplexed over the same connection to the-numbers.com
+    """
+    limits = httpx.Limits(max_connections=max_workers, max_keepalive_connections=max_workers)
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=3)
+    return httpx.AsyncClient(
+        transport=transport,
+        headers=HEADERS,
+        timeout=30.0,
+        follow_redirects=True
+    )
+
+def create_limiter(rate_per_sec=4):
+    """
+    Creating the rate limiter shared by all tasks
+    
+    aiolimiter can't hand out a request from a bucket smaller than one, so
+    rates below 1 per second become one request every 1 / rate_per_sec seconds.
+    """
+    if rate_per_sec <= 0:
+        raise ValueError(f"Requests per second must be positive, got {rate_per_sec}")
+    if rate_per_sec < 1:
+        return AsyncLimiter(1, 1 / rate_per_sec)
+    return AsyncLimiter(rate_per_sec, 1)
+
+
+# In[ ]:
+
+
+# Defining conditional request cache helpers
+NOT_MODIFIED = "Not modified since last run"
+
+def open_validator_cache(cache_path):
+    """Opening the sqlite cache holding ETag/Last-Modified validators per URL"""
+    cache = sqlite3.connect(cache_path)
+    cache.execute(
+        "CREATE TABLE IF NOT EXISTS validators "
+        "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, csv_path TEXT)"
+    )
+    return cache
+
+def get_conditional_headers(cache, url):
+    """
+    Building If-None-Match/If-Modified-Since headers for a URL
+    
+    Returns the headers and the CSV produced by the cached page (None when the
+    page had no daily box office section). No headers are sent when that CSV
+    has since been deleted, so the page gets fetched and parsed again.
+    """
+    row = cache.execute(
+        "SELECT etag, last_modified, csv_path FROM validators WHERE url = ?", (url,)
+    ).fetchone()
+    if row is None:
+        return {}, None
+    
+    etag, last_modified, csv_path = row
+    if csv_path is not None and not os.path.exists(csv_path):
+        return {}, None
+    
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers, csv_path
+
+def save_validators(cache, url, response, csv_path):
+    """Storing a response's validators together with the CSV it produced"""
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag is None and last_modified is None:
+        return
+    cache.execute(
+        "INSERT OR REPLACE INTO validators VALUES (?, ?, ?, ?)",
+        (url, etag, last_modified, csv_path)
+    )
+    cache.commit()
+
+
+# In[ ]:
+
+
 # Defining helper functions
-def create_safe_filename(movie_name):
-    """Creating a safe filename by removing or replacing invalid characters"""
-    invalid_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*', "'"]
-    safe_name = movie_name
-    for char in invalid_chars:
-        safe_name = safe_name.replace(char, '')
-    safe_name = safe_name.replace(' ', '_').replace('__', '_')
-    safe_name = safe_name.rstrip('.')
-    return safe_name
+# Matching the characters that are invalid in filenames
+_UNSAFE_FILENAME_PATTERN = r'[<>:"/\\|?*\']'
+
+def write_csv(df, path):
+    """Writing a DataFrame to CSV with pyarrow's C++ writer, which releases the GIL"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, path)
+
+def append_csv(df, sink, include_header):
+    """Appending a DataFrame's rows to an already open CSV file"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, sink, write_options=pacsv.WriteOptions(include_header=include_header))
+
+
+# Columns read from the metadata file, everything else is left on disk
+METADATA_COLUMNS = ['original_title', 'release_year', 'daily_box_office_path']
 
 def load_and_validate_metadata(metadata_path):
     """
     Loading and validating metadata file and filtering movies after 2010
     """
     try:
-        # Reading metadata file with low_memory=False
-        metadata_df = pd.read_csv(metadata_path, low_memory=False)
-        print("Original columns:", metadata_df.columns.tolist())
+        # Reading only the header to validate the columns
+        available_columns = pd.read_csv(metadata_path, nrows=0).columns.tolist()
+        print("Original columns:", available_columns)
         
         # Checking for required columns
         required_columns = ['original_title', 'release_year']
-        missing_columns = [col for col in required_columns if col not in metadata_df.columns]
+        missing_columns = [col for col in required_columns if col not in available_columns]
         
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
         
+        # Reading just the needed columns with pyarrow's multithreaded CSV reader
+        include_columns = [col for col in METADATA_COLUMNS if col in available_columns]
+        metadata_df = pacsv.read_csv(
+            metadata_path,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=include_columns,
+                column_types={'daily_box_office_path': pa.string()},
+                strings_can_be_null=True
+            )
+        ).to_pandas(types_mapper=pd.ArrowDtype)
+        
         # Creating movie_name column from original_title
         metadata_df['movie_name'] = metadata_df['original_title']
         
+        # Cleaning all movie names for URLs in one pass
+        metadata_df['url_slug'] = (
+            metadata_df['movie_name']
+            .str.replace(':', '', regex=False)
+            .str.replace('&', 'and', regex=False)
+            .str.replace(' ', '-', regex=False)
+        )
+        
+        # Creating safe filenames by removing or replacing invalid characters
+        metadata_df['safe_name'] = (
+            metadata_df['movie_name']
+            .str.replace(_UNSAFE_FILENAME_PATTERN, '', regex=True)
+            .str.replace(' ', '_', regex=False)
+            .str.replace('__', '_', regex=False)
+            .str.rstrip('.')
+        )
+        
         # Filtering movies after 2010 using existing release_year column
-        metadata_df = metadata_df[metadata_df['release_year'] >= 2010]
+        metadata_df = metadata_df[(metadata_df['release_year'] >= 2010).fillna(False)]
         
         # Adding daily_box_office_path column if it doesn't exist
         if 'daily_box_office_path' not in metadata_df.columns:
@@ -66,63 +203,272 @@ def load_and_validate_metadata(metadata_path):
         print(f"Detailed error info: {str(e)}")
         return None
 
+def save_metadata(metadata_df, metadata_path):
+    """
+    Writing the scraped paths back into the full metadata file
+    
+    Only a few columns are loaded for scraping, so the remaining columns are
+    read back here once, at the end of the run, and kept as they were.
+    """
+    full_df = pd.read_csv(metadata_path, low_memory=False)
+    if 'daily_box_office_path' not in full_df.columns:
+        full_df['daily_box_office_path'] = None
+    full_df['daily_box_office_path'] = full_df['daily_box_office_path'].astype(object)
+    full_df.loc[metadata_df.index, 'daily_box_office_path'] = metadata_df['daily_box_office_path'].astype(object)
+    full_df.to_csv(metadata_path, index=False)
+
+
+# In[ ]:
+
+
+# Defining progress checkpoint helpers
+PROGRESS_SCHEMA = pa.schema([
+    ('idx', pa.int64()),
+    ('daily_box_office_path', pa.string()),
+    ('status', pa.string())
+])
+
+def save_progress(progress_rows, progress_path):
+    """Appending a batch of completed movies to the progress dataset as a new file"""
+    table = pa.Table.from_pylist(progress_rows, schema=PROGRESS_SCHEMA)
+    pq.write_to_dataset(table, progress_path)
+
+def load_progress(metadata_df, progress_path):
+    """Merging paths checkpointed by earlier runs into the metadata"""
+    if not os.path.exists(progress_path):
+        return
+    
+    progress_df = pq.read_table(progress_path, schema=PROGRESS_SCHEMA).to_pandas()
+    completed = progress_df[
+        (progress_df['status'] == 'success') & progress_df['idx'].isin(metadata_df.index)
+    ].drop_duplicates('idx', keep='last')
+    metadata_df.loc[completed['idx'], 'daily_box_office_path'] = completed['daily_box_office_path'].values
+    print(f"Restored {len(completed)} completed movies from {progress_path}")
+
+def clear_progress(progress_path):
+    """Removing the progress dataset once its rows are saved in the metadata file"""
+    shutil.rmtree(progress_path, ignore_errors=True)
+
+# In[ ]:
+
+
+# Defining result writer helpers
+ERROR_LOG_FIELDS = ['movie', 'error', 'row']
+
+def run_result_writer(result_queue, error_log_path, progress_path, combined_filename,
+                      completed_paths, combined_written, writer_errors, flush_interval=5.0):
+    """
+    Persisting scraped results on a dedicated thread until None is queued
+    
+    Errors are appended to an error log kept open for the whole run, new movie
+    data is streamed into the combined CSV and successful paths are collected
+    in completed_paths. Progress rows are flushed to the progress dataset every
+    flush_interval seconds instead of once per movie. An exception stops the
+    writer and is stored in writer_errors for the main thread to re-raise.
+    """
+    progress_rows = []
+    combined_file = None
+    combined_columns = None
+    last_flush = time.monotonic()
+    
+    try:
+        with open(error_log_path, 'w', newline='', encoding='utf-8') as error_file:
+            error_writer = csv.DictWriter(error_file, fieldnames=ERROR_LOG_FIELDS)
+            error_writer.writeheader()
+            
+            while True:
+                try:
+                    result = result_queue.get(timeout=flush_interval)
+                except queue.Empty:
+                    result = {}
+                
+                if result is None:
+                    break
+                
+                if result:
+                    progress_rows.append({
+                        'idx': result['idx'],
+                        'daily_box_office_path': result.get('path'),
+                        'status': 'success' if result['success'] else 'failed'
+                    })
+                    
+                    if result['success']:
+                        completed_paths[result['idx']] = result['path']
+                        
+                        # Unchanged pages carry no data, so their CSV from an earlier run is reused
+                        movie_df = result['data']
+                        if movie_df is None:
+                            movie_df = pacsv.read_csv(result['filename']).to_pandas()
+                        
+                        # Streaming each movie's rows straight to the combined file
+                        include_header = combined_file is None
+                        if include_header:
+                            combined_file = open(combined_filename, 'wb')
+                            combined_columns = movie_df.columns
+                            combined_written.set()
+                        # The header is already written, so other columns can't be added later
+                        dropped_columns = movie_df.columns.difference(combined_columns).tolist()
+                        missing_columns = combined_columns.difference(movie_df.columns).tolist()
+                        if dropped_columns or missing_columns:
+                            print(
+                                f"Warning: columns for {result['movie_name']} differ from the combined file "
+                                f"(dropped: {dropped_columns}, left empty: {missing_columns})"
+                            )
+                        movie_rows = movie_df.reindex(columns=combined_columns)
+                        append_csv(movie_rows, combined_file, include_header)
+                    else:
+                        error_writer.writerow({
+                            'movie': result['movie_name'],
+                            'error': result['error'],
+                            'row': result['idx']
+                        })
+                
+                # Checkpointing periodically rather than after every movie
+                if progress_rows and time.monotonic() - last_flush >= flush_interval:
+                    save_progress(progress_rows, progress_path)
+                    error_file.flush()
+                    progress_rows = []
+                    last_flush = time.monotonic()
+            
+            if progress_rows:
+                save_progress(progress_rows, progress_path)
+    except Exception as e:
+        writer_errors.append(e)
+    finally:
+        if combined_file is not None:
+            combined_file.close()
+
 
 # In[ ]:
 
 
 # Defining scraping functions
-def scrape_daily_box_office(movie_name, release_year):
+# Matching the currency symbols and thousands separators in the Gross column
+_GROSS_PATTERN = r'[$,]'
+
+# Compiling the XPath expressions used on every streamed element once
+# (normalize-space only trims ASCII whitespace, so results are also .strip()ped for &nbsp;)
+_TEXT_XPATH = etree.XPath("normalize-space(.)", smart_strings=False)
+_ROWS_XPATH = etree.XPath(".//tr")
+_CELLS_XPATH = etree.XPath("./th|./td")
+
+async def read_daily_table(response):
+    """
+    Stream-parsing a page until the table following the daily box office heading
+    
+    Only h2 and table elements are reported by the parser, and each one is
+    cleared once checked so the page never builds up into a full tree. Returns
+    the table rows as lists of cell texts (None when the page has no such
+    section); the rest of the body isn't downloaded once the table is read.
+    Tables enclosing the heading end after it but come before it in the page,
+    so they are skipped like find_next('table') does.
+    """
+    parser = etree.HTMLPullParser(events=('end',), tag=('h2', 'table'))
+    after_heading = False
+    heading_tables = set()
+    
+    async for chunk in response.aiter_bytes():
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            if elem.tag == 'h2':
+                after_heading = _TEXT_XPATH(elem).strip() == 'Daily Box Office Performance'
+                if after_heading:
+                    heading_tables = set(elem.iterancestors('table'))
+            elif elem in heading_tables:
+                # Keeping the enclosing table intact, its end comes before the target's
+                continue
+            elif after_heading:
+                return [
+                    [_TEXT_XPATH(cell).strip() for cell in _CELLS_XPATH(row)]
+                    for row in _ROWS_XPATH(elem)
+                ]
+            
+            # Dropping the checked element and everything parsed before it
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    
+    return None
+
+async def scrape_daily_box_office(client, limiter, cache, movie_name, url_slug, release_year, movie_filename):
     """
     Scraping daily box office data for a single movie
+    
+    Returns (None, NOT_MODIFIED) when the page is unchanged since it was last
+    saved to movie_filename, so nothing needs to be parsed or written.
+    The secondary URL is only tried when the primary one is missing (404) or
+    redirects away from the movie page, not when the page simply has no data.
     """
     try:
-        # Cleaning movie name for URL
-        url_name = movie_name.replace(":", "").replace("&", "and").replace(" ", "-")
         year = int(release_year)
 
         # Defining both URL formats
-        url_primary = f"https://www.the-numbers.com/movie/{url_name}-({year})#tab=box-office"
-        url_secondary = f"https://www.the-numbers.com/movie/{url_name}#tab=box-office"
+        url_primary = f"https://www.the-numbers.com/movie/{url_slug}-({year})#tab=box-office"
+        url_secondary = f"https://www.the-numbers.com/movie/{url_slug}#tab=box-office"
         urls = [url_primary, url_secondary]
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-        
         for url in urls:
             try:
                 print(f"Trying URL: {url}")
-                time.sleep(1) # Reduced delay for parallel processing
-                response = requests.get(url, headers=headers)
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.text, "html.parser")
-                heading = soup.find('h2', string='Daily Box Office Performance')
+                conditional_headers, cached_csv = get_conditional_headers(cache, url)
                 
-                if heading:
-                    daily_table = heading.find_next('table')
-                    if daily_table:
-                        table_headers = [th.get_text(strip=True) for th in daily_table.find('tr').find_all(['th', 'td'])]
+                # Waiting for the shared rate limiter instead of a fixed delay
+                await limiter.acquire()
+                async with client.stream('GET', url, headers=conditional_headers) as response:
+                    # Reusing the previous outcome when the page hasn't changed
+                    if response.status_code == 304:
+                        if cached_csv is not None:
+                            print(f"Page not modified at {url} for {movie_name}, keeping {cached_csv}")
+                            return None, NOT_MODIFIED
+                        print(f"Page not modified at {url} for {movie_name} and had no daily box office section.")
+                        return None, "No data found"
+                    response.raise_for_status()
+                    
+                    # Falling back when the primary URL landed on a different page
+                    if url == url_primary and response.url.path != httpx.URL(url).path:
+                        print(f"{url} redirected to {response.url} for {movie_name}. Trying next URL if available...")
+                        continue
+                    
+                    table_rows = await read_daily_table(response)
+                    
+                    if table_rows:
+                        table_headers = table_rows[0]
+                        
+                        # Keeping the last cell for repeated headers (e.g. blank ones), like dict(zip(...))
+                        header_positions = {header: position for position, header in enumerate(table_headers)}
                         
-                        all_data = []
-                        for row in daily_table.find_all('tr')[1:]:
-                            cols = row.find_all(['th', 'td'])
-                            row_data = [col.get_text(strip=True) for col in cols]
+                        # Collecting values column by column
+                        columns = {header: [] for header in header_positions}
+                        columns['Movie_Name'] = []
+                        for row_data in table_rows[1:]:
                             if len(row_data) == len(table_headers):
-                                row_dict = dict(zip(table_headers, row_data))
-                                row_dict['Movie_Name'] = movie_name
-                                all_data.append(row_dict)
+                                for header, position in header_positions.items():
+                                    columns[header].append(row_data[position])
+                                columns['Movie_Name'].append(movie_name)
                         
-                        if all_data:
-                            df = pd.DataFrame(all_data)
+                        if columns['Movie_Name']:
+                            df = pd.DataFrame(columns, copy=False)
                             if 'Gross' in df.columns:
-                                df['Gross'] = df['Gross'].str.replace('$', '', regex=False).str.replace(',', '', regex=False)
+                                df['Gross'] = pd.to_numeric(
+                                    df['Gross'].str.replace(_GROSS_PATTERN, '', regex=True),
+                                    errors='coerce',
+                                    downcast='integer'
+                                )
+                            save_validators(cache, url, response, movie_filename)
                             return df, None
+                    
+                    save_validators(cache, url, response, None)
                 
-                print(f"Daily box office section not found at {url} for {movie_name}. Trying next URL if available...")
-            except requests.exceptions.RequestException as e:
+                # Treating a valid movie page without the section as having no data
+                print(f"Daily box office section not found at {url} for {movie_name}.")
+                return None, "No data found"
+            except httpx.HTTPError as e:
+                # Falling back only when the movie page doesn't exist at this URL
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 404:
+                    print(f"Page not found at {url} for {movie_name}. Trying next URL if available...")
+                    continue
                 print(f"Error with URL {url}: {e}")
-                continue
+                return None, str(e)
         
         return None, "No data found"
 
@@ -134,21 +480,19 @@ def scrape_daily_box_office(movie_name, release_year):
 # In[ ]:
 
 
-def process_movie_batch(movie_data):
-    """Processing a single movie within a batch"""
-    movie_name = movie_data['movie_name']
-    release_year = movie_data['release_year']
-    idx = movie_data['idx']
-    output_folder = movie_data['output_folder']
-    project_root = movie_data['project_root']
-    
+async def process_movie_batch(movie_name, url_slug, safe_name, release_year, idx, output_folder, project_root, client, limiter, cache):
+    """Processing a single movie"""
     try:
-        movie_df, error = scrape_daily_box_office(movie_name, release_year)
+        movie_filename = os.path.join(output_folder, f"{safe_name}_daily.csv")
+        
+        movie_df, error = await scrape_daily_box_office(
+            client, limiter, cache, movie_name, url_slug, release_year, movie_filename
+        )
         
-        if movie_df is not None:
-            safe_movie_name = create_safe_filename(movie_name)
-            movie_filename = os.path.join(output_folder, f"{safe_movie_name}_daily.csv")
-            movie_df.to_csv(movie_filename, index=False)
+        if movie_df is not None or error == NOT_MODIFIED:
+            # Skipping the write when the existing CSV is still up to date
+            if movie_df is not None:
+                await asyncio.to_thread(write_csv, movie_df, movie_filename)
             
             # Creating relative path
             relative_path = os.path.relpath(movie_filename, project_root)
@@ -158,6 +502,7 @@ def process_movie_batch(movie_data):
                 'movie_name': movie_name,
                 'idx': idx,
                 'data': movie_df,
+                'filename': movie_filename,
                 'path': relative_path
             }
         else:
@@ -176,9 +521,18 @@ def process_movie_batch(movie_data):
             'error': str(e)
         }
 
-def parallel_scrape_movies(metadata_df, metadata_path, output_folder, project_root, start_row=0, batch_size=50, max_workers=5):
+async def scrape_worker(todo_rows, scrape_movie, result_queue, writer_errors, progress_bar):
+    """Scraping movies from the shared work list until it runs out or the writer fails"""
+    for idx, movie_name, url_slug, safe_name, release_year in todo_rows:
+        if writer_errors:
+            return
+        result = await scrape_movie(movie_name, url_slug, safe_name, release_year, idx)
+        result_queue.put(result)
+        progress_bar.update(1)
+
+async def parallel_scrape_movies(metadata_df, metadata_path, output_folder, project_root, start_row=0, max_workers=5, rate_per_sec=4):
     """
-    Scraping multiple movies in parallel using batches
+    Scraping multiple movies concurrently with a fixed pool of workers
     
     Parameters:
     - metadata_df: DataFrame containing movie metadata
@@ -186,88 +540,82 @@ def parallel_scrape_movies(metadata_df, metadata_path, output_folder, project_ro
     - output_folder: Where to save movie data
     - project_root: Root folder for relative paths
     - start_row: Row to start from
-    - batch_size: Movies per batch
-    - max_workers: Parallel workers
+    - max_workers: Number of concurrent workers
+    - rate_per_sec: Maximum requests per second across all tasks
     """
     os.makedirs(output_folder, exist_ok=True)
     error_log_path = os.path.join(output_folder, 'error_log.csv')
-    error_log = []
-    all_movies_data = []
+    progress_path = os.path.join(output_folder, 'progress.parquet')
+    combined_filename = os.path.join(output_folder, "all_movies_daily_data.csv")
+    cache = open_validator_cache(os.path.join(output_folder, 'http_cache.sqlite'))
+    
+    # Picking up movies checkpointed by an earlier, interrupted run
+    load_progress(metadata_df, progress_path)
     
-    # Calculating total batches
-    total_rows = len(metadata_df) - start_row
-    total_batches = (total_rows + batch_size - 1) // batch_size
+    # Selecting the unprocessed movies once for the whole run
+    todo = metadata_df.iloc[start_row:]
+    todo = todo.loc[todo['daily_box_office_path'].isna(), ['movie_name', 'url_slug', 'safe_name', 'release_year']]
+    
+    total_rows = len(todo)
     
     print(f"Starting scraping from row {start_row}")
+    print(f"Already processed movies skipped: {len(metadata_df) - start_row - total_rows}")
     print(f"Total movies to process: {total_rows}")
-    print(f"Total batches: {total_batches}")
-    print(f"Movies per batch: {batch_size}")
-    print(f"Parallel workers: {max_workers}")
+    print(f"Concurrent workers: {max_workers}")
+    print(f"Requests per second: {rate_per_sec}")
     
-    # Processing in batches
-    for batch_num in range(total_batches):
-        batch_start = start_row + (batch_num * batch_size)
-        batch_end = min(batch_start + batch_size, len(metadata_df))
-        batch_df = metadata_df.iloc[batch_start:batch_end]
-        
-        print(f"\nProcessing Batch {batch_num + 1}/{total_batches}")
-        print(f"Rows {batch_start} to {batch_end}")
-        
-        # Preparing batch data
-        batch_data = [
-            {
-                'movie_name': row['movie_name'],
-                'release_year': row['release_year'],
-                'idx': idx,
-                'output_folder': output_folder,
-                'project_root': project_root
-            }
-            for idx, row in batch_df.iterrows()
-            if pd.isna(row['daily_box_office_path']) # Skipping already processed movies
-        ]
-        
-        if not batch_data:
-            print("All movies in this batch already processed, moving to next batch...")
-            continue
-        
-        # Processing batch in parallel
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(process_movie_batch, movie_data): movie_data
-                for movie_data in batch_data
-            }
-            
-            # Processing results as they complete
-            for future in tqdm(as_completed(futures), total=len(batch_data), desc=f"Batch {batch_num + 1}"):
-                result = future.result()
-                
-                if result['success']:
-                    all_movies_data.append(result['data'])
-                    # Updating metadata
-                    metadata_df.loc[result['idx'], 'daily_box_office_path'] = result['path']
-                else:
-                    error_log.append({
-                        'movie': result['movie_name'],
-                        'error': result['error'],
-                        'row': result['idx']
-                    })
+    # Handing results to a single writer thread so disk I/O never blocks scraping
+    result_queue = queue.Queue()
+    completed_paths = {}
+    combined_written = threading.Event()
+    writer_errors = []
+    writer = threading.Thread(
+        target=run_result_writer,
+        args=(result_queue, error_log_path, progress_path, combined_filename, completed_paths, combined_written, writer_errors),
+        daemon=True
+    )
+    writer.start()
+    
+    # Sharing one HTTP/2 client across all workers for the whole run
+    limiter = create_limiter(rate_per_sec)
+    async with create_client(max_workers) as client:
+        # Binding the arguments shared by every movie once for the whole run
+        scrape_movie = partial(
+            process_movie_batch,
+            output_folder=output_folder,
+            project_root=project_root,
+            client=client,
+            limiter=limiter,
+            cache=cache
+        )
         
-        # Saving progress after each batch
-        metadata_df.to_csv(metadata_path, index=False)
-        pd.DataFrame(error_log).to_csv(error_log_path, index=False)
-        print(f"Completed batch {batch_num + 1}/{total_batches}")
+        # Feeding every worker from one shared iterator over the work list
+        todo_rows = todo.itertuples(index=True, name=None)
+        with tqdm(total=total_rows, desc="Scraping movies") as progress_bar:
+            await asyncio.gather(*(
+                scrape_worker(todo_rows, scrape_movie, result_queue, writer_errors, progress_bar)
+                for _ in range(max_workers)
+            ))
     
-    # Saving final combined results
-    if all_movies_data:
-        try:
-            combined_df = pd.concat(all_movies_data, ignore_index=True)
-            combined_filename = os.path.join(output_folder, "all_movies_daily_data.csv")
-            combined_df.to_csv(combined_filename, index=False)
-            print(f"\nCombined data saved to {combined_filename}")
-            return combined_df
-        except Exception as e:
-            print(f"\nError saving combined data: {e}")
-            return pd.concat(all_movies_data, ignore_index=True)
+    cache.close()
+    
+    # Waiting for the writer to persist everything still queued
+    result_queue.put(None)
+    await asyncio.to_thread(writer.join)
+    
+    # Failing the run rather than saving metadata from a partial set of results
+    if writer_errors:
+        raise RuntimeError(f"Result writer failed: {writer_errors[0]}") from writer_errors[0]
+    
+    # Saving the full metadata once, now that every movie is checkpointed
+    if completed_paths:
+        metadata_df.loc[list(completed_paths), 'daily_box_office_path'] = list(completed_paths.values())
+    await asyncio.to_thread(save_metadata, metadata_df, metadata_path)
+    clear_progress(progress_path)
+    
+    if combined_written.is_set():
+        print(f"\nCombined data saved to {combined_filename}")
+        return combined_filename
     
     return None
 
@@ -275,47 +623,50 @@ def parallel_scrape_movies(metadata_df, metadata_path, output_folder, project_ro
 # In[ ]:
 
 
-# Setting paths
-# Comment: Replace the following path with the path to your metadata CSV file
-metadata_path = r"path/to/your/movies_metadata.csv"
-# Comment: Replace the following path with the root directory of your project
-project_root = r"path/to/your/project/root"
-output_folder = os.path.join(project_root, 'data', 'raw', 'completed_movies')
+# Running the scraper when executed as a script, not on import
+# (in Jupyter, where an event loop is already running, await parallel_scrape_movies(...) in a cell instead)
+if __name__ == "__main__":
+    # Setting paths
+    # Comment: Replace the following path with the path to your metadata CSV file
+    metadata_path = r"path/to/your/movies_metadata.csv"
+    # Comment: Replace the following path with the root directory of your project
+    project_root = r"path/to/your/project/root"
+    output_folder = os.path.join(project_root, 'data', 'raw', 'completed_movies')
 
-# Loading metadata
-metadata_df = load_and_validate_metadata(metadata_path)
+    # Loading metadata
+    metadata_df = load_and_validate_metadata(metadata_path)
 
-if metadata_df is not None:
-    # Getting user inputs for configuration
-    start_row = input("\nEnter row number to start from (press Enter for 0): ")
-    start_row = int(start_row) if start_row.strip() else 0
-    
-    batch_size = input("Enter batch size (press Enter for 50): ")
-    batch_size = int(batch_size) if batch_size.strip() else 50
-    
-    max_workers = input("Enter number of parallel workers (press Enter for 5): ")
-    max_workers = int(max_workers) if max_workers.strip() else 5
-    
-    print(f"\nStarting scraping from row {start_row}")
-    print(f"Movie at starting row: {metadata_df.iloc[start_row]['movie_name']}")
-
-    try:
-        completed_data = parallel_scrape_movies(
-            metadata_df=metadata_df,
-            metadata_path=metadata_path,
-            output_folder=output_folder,
-            project_root=project_root,
-            start_row=start_row,
-            batch_size=batch_size,
-            max_workers=max_workers
-        )
+    if metadata_df is not None:
+        # Getting user inputs for configuration
+        start_row = input("\nEnter row number to start from (press Enter for 0): ")
+        start_row = int(start_row) if start_row.strip() else 0
         
-        print("\nScraping completed successfully!")
-    except Exception as e:
-        print(f"\nError occurred during scraping: {str(e)}")
-        raise e
-else:
-    print("Failed to load metadata. Please check the file path and format.")
+        max_workers = input("Enter number of concurrent workers (press Enter for 5): ")
+        max_workers = int(max_workers) if max_workers.strip() else 5
+        
+        rate_per_sec = input("Enter requests per second (press Enter for 4): ")
+        rate_per_sec = float(rate_per_sec) if rate_per_sec.strip() else 4
+        
+        print(f"\nStarting scraping from row {start_row}")
+        print(f"Movie at starting row: {metadata_df.iloc[start_row]['movie_name']}")
+
+        try:
+            completed_data = asyncio.run(parallel_scrape_movies(
+                metadata_df=metadata_df,
+                metadata_path=metadata_path,
+                output_folder=output_folder,
+                project_root=project_root,
+                start_row=start_row,
+                max_workers=max_workers,
+                rate_per_sec=rate_per_sec
+            ))
+            
+            print("\nScraping completed successfully!")
+        except Exception as e:
+            print(f"\nError occurred during scraping: {str(e)}")
+            raise e
+    else:
+        print("Failed to load metadata. Please check the file path and format.")
 
 
 # In[ ]:
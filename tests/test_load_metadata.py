@@ -0,0 +1,33 @@
+import os
+import unittest
+
+import DataScrapping
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+METADATA_PATH = os.path.join(PROJECT_ROOT, 'movies_metadata.csv')
+
+
+class LoadMetadataTest(unittest.TestCase):
+    """Loading the bundled metadata file end to end"""
+
+    def test_loads_bundled_metadata(self):
+        metadata_df = DataScrapping.load_and_validate_metadata(METADATA_PATH)
+
+        self.assertIsNotNone(metadata_df)
+        self.assertFalse(metadata_df.empty)
+        self.assertTrue((metadata_df['release_year'] >= 2010).all())
+        for column in ['movie_name', 'url_slug', 'safe_name', 'daily_box_office_path']:
+            self.assertIn(column, metadata_df.columns)
+
+    def test_builds_url_slugs_and_safe_names(self):
+        metadata_df = DataScrapping.load_and_validate_metadata(METADATA_PATH)
+
+        for movie_name, url_slug, safe_name in metadata_df[['movie_name', 'url_slug', 'safe_name']].itertuples(index=False):
+            self.assertNotIn(' ', url_slug)
+            self.assertNotIn(':', url_slug)
+            self.assertFalse(set(safe_name) & set('<>:"/\\|?*\' '))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import asyncio
+import unittest
+
+import httpx
+
+import DataScrapping
+
+
+def read_table(page):
+    """Running read_daily_table on an in-memory response"""
+    response = httpx.Response(200, content=page)
+    return asyncio.run(DataScrapping.read_daily_table(response))
+
+
+class ReadDailyTableTest(unittest.TestCase):
+    """Finding the table that follows the daily box office heading"""
+
+    def test_finds_table_wrapped_after_heading(self):
+        page = b"""<html><body>
+            <h2>Weekend Box Office Performance</h2><table><tr><td>weekend</td></tr></table>
+            <h2>Daily Box Office Performance</h2>
+            <div><div><table>
+                <tr><th>Date</th><th>Gross</th></tr>
+                <tr><td>Jan 1</td><td>$1,234</td></tr>
+            </table></div></div>
+        </body></html>"""
+
+        self.assertEqual(read_table(page), [['Date', 'Gross'], ['Jan 1', '$1,234']])
+
+    def test_skips_table_enclosing_heading(self):
+        page = b"""<html><body>
+            <table><tr><td><h2>Daily Box Office Performance</h2></td></tr></table>
+            <table>
+                <tr><th>Date</th><th>Gross</th></tr>
+                <tr><td>Jan 1</td><td>$1,234</td></tr>
+            </table>
+        </body></html>"""
+
+        self.assertEqual(read_table(page), [['Date', 'Gross'], ['Jan 1', '$1,234']])
+
+    def test_strips_nbsp_around_cells(self):
+        page = b"""<html><body>
+            <h2>&nbsp;Daily Box Office Performance&nbsp;</h2>
+            <table>
+                <tr><th>Date</th><th>&nbsp;</th><th>Gross</th></tr>
+                <tr><td>Jan 1</td><td>x</td><td>&nbsp;$1,234&nbsp;</td></tr>
+            </table>
+        </body></html>"""
+
+        self.assertEqual(read_table(page), [['Date', '', 'Gross'], ['Jan 1', 'x', '$1,234']])
+
+    def test_returns_none_without_heading(self):
+        page = b"<html><body><h2>Other</h2><table><tr><td>x</td></tr></table></body></html>"
+
+        self.assertIsNone(read_table(page))
+
+
+if __name__ == '__main__':
+    unittest.main()